@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+import pytest
+
+os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(), "test.db")
+
+from app import app, db, product_cache, user_cache  # noqa: E402
+
+
+@pytest.fixture
+def client():
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    product_cache.clear()
+    user_cache.clear()
+    return app.test_client()
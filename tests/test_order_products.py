@@ -0,0 +1,107 @@
+import pytest
+
+from app import MAX_BATCH_SIZE, OrderProduct, app, db
+
+
+@pytest.fixture
+def order(client):
+    user_id = client.post(
+        "/users", json={"name": "n", "address": "a", "email": "a@example.com"}
+    ).json["id"]
+    for i in range(3):
+        client.post("/products", json={"product_name": f"p{i}", "price": 1})
+    return client.post("/orders", json={"user_id": user_id}).json["id"]
+
+
+def order_product_ids(client, order_id):
+    return sorted(p["id"] for p in client.get(f"/orders/{order_id}/products").json)
+
+
+def test_add_products(client, order):
+    response = client.post(f"/orders/{order}/add_products", json={"product_ids": [1, 2, 2]})
+
+    assert response.status_code == 200
+    assert order_product_ids(client, order) == [1, 2]
+
+
+def test_add_products_skips_products_already_in_order(client, order):
+    client.post(f"/orders/{order}/add_products", json={"product_ids": [1]})
+
+    response = client.post(f"/orders/{order}/add_products", json={"product_ids": [1, 3]})
+
+    assert response.status_code == 200
+    assert order_product_ids(client, order) == [1, 3]
+
+
+@pytest.mark.parametrize(
+    "product_ids",
+    [None, [], [1, "2"], [True], list(range(1, MAX_BATCH_SIZE + 2))],
+)
+def test_add_products_validation(client, order, product_ids):
+    response = client.post(f"/orders/{order}/add_products", json={"product_ids": product_ids})
+
+    assert response.status_code == 400
+    with app.app_context():
+        assert db.session.query(OrderProduct).count() == 0
+
+
+def test_add_products_missing_order_or_product(client, order):
+    assert client.post("/orders/99/add_products", json={"product_ids": [1]}).status_code == 404
+    assert client.post(f"/orders/{order}/add_products", json={"product_ids": [1, 99]}).status_code == 404
+    assert order_product_ids(client, order) == []
+
+
+def test_add_product(client, order):
+    response = client.put(f"/orders/{order}/add_product/1")
+
+    assert response.json == {"message": "Product added to order"}
+    assert order_product_ids(client, order) == [1]
+
+
+def test_add_product_already_in_order(client, order):
+    client.put(f"/orders/{order}/add_product/1")
+
+    response = client.put(f"/orders/{order}/add_product/1")
+
+    assert response.status_code == 200
+    assert response.json == {"message": "Product already in order"}
+    assert order_product_ids(client, order) == [1]
+
+
+def test_add_product_missing_order_or_product(client, order):
+    response = client.put("/orders/99/add_product/1")
+    assert response.status_code == 404
+    assert response.json == {"error": "Order not found"}
+
+    response = client.put(f"/orders/{order}/add_product/99")
+    assert response.status_code == 404
+    assert response.json == {"error": "Product not found"}
+
+    assert order_product_ids(client, order) == []
+
+
+def test_remove_product(client, order):
+    client.put(f"/orders/{order}/add_product/1")
+    client.put(f"/orders/{order}/add_product/2")
+
+    response = client.delete(f"/orders/{order}/remove_product/1")
+
+    assert response.json == {"message": "Product removed from order"}
+    assert order_product_ids(client, order) == [2]
+
+
+def test_remove_product_not_in_order(client, order):
+    response = client.delete(f"/orders/{order}/remove_product/1")
+
+    assert response.status_code == 200
+    assert response.json == {"message": "Product not in order"}
+
+
+def test_remove_product_missing_order_or_product(client, order):
+    response = client.delete("/orders/99/remove_product/1")
+    assert response.status_code == 404
+    assert response.json == {"error": "Order not found"}
+
+    response = client.delete(f"/orders/{order}/remove_product/99")
+    assert response.status_code == 404
+    assert response.json == {"error": "Product not found"}
@@ -0,0 +1,57 @@
+import pytest
+
+from app import Order, User, app, db
+
+
+def add_user(client, email):
+    response = client.post("/users", json={"name": "n", "address": "a", "email": email})
+    assert response.status_code == 201
+    return response.json["id"]
+
+
+def test_create_order(client):
+    user_id = add_user(client, "a@example.com")
+
+    response = client.post(
+        "/orders", json={"user_id": user_id, "order_date": "2026-02-28T15:30:00"}
+    )
+
+    assert response.status_code == 201
+    assert response.json["user_id"] == user_id
+    assert response.json["order_date"] == "2026-02-28T15:30:00"
+
+
+@pytest.mark.parametrize("order_date", [None, ""])
+def test_create_order_empty_date_uses_default(client, order_date):
+    user_id = add_user(client, "a@example.com")
+
+    response = client.post("/orders", json={"user_id": user_id, "order_date": order_date})
+
+    assert response.status_code == 201
+    assert response.json["order_date"]
+
+
+def test_create_order_rejects_id(client):
+    first = add_user(client, "a@example.com")
+    second = add_user(client, "b@example.com")
+    order_id = client.post("/orders", json={"user_id": first}).json["id"]
+
+    response = client.post("/orders", json={"id": order_id, "user_id": second})
+
+    assert response.status_code == 400
+    with app.app_context():
+        assert db.session.get(Order, order_id).user_id == first
+
+
+def test_create_order_validation(client):
+    assert client.post("/orders", json={}).status_code == 400
+    assert client.post("/orders", json={"user_id": 0}).status_code == 400
+    assert client.post("/orders", json={"user_id": 1, "order_date": "soon"}).status_code == 400
+
+
+def test_create_order_unknown_user(client):
+    response = client.post("/orders", json={"user_id": 42})
+
+    assert response.status_code == 404
+    with app.app_context():
+        assert db.session.get(User, 42) is None
@@ -0,0 +1,66 @@
+import pytest
+
+from app import MAX_PAGE_SIZE, Product, app, db
+
+
+@pytest.fixture
+def products(client):
+    with app.app_context():
+        db.session.add_all(
+            Product(product_name=f"p{i}", price=1) for i in range(MAX_PAGE_SIZE + 5)
+        )
+        db.session.commit()
+    return client
+
+
+def test_cursor_chaining(products):
+    first = products.get("/products?limit=2").json
+    assert [p["id"] for p in first["items"]] == [1, 2]
+    assert first["next"] == 2
+
+    second = products.get(f"/products?limit=2&cursor={first['next']}").json
+    assert [p["id"] for p in second["items"]] == [3, 4]
+    assert second["next"] == 4
+
+
+def test_short_page_has_no_next(products):
+    page = products.get(f"/products?limit=10&cursor={MAX_PAGE_SIZE}").json
+
+    assert len(page["items"]) == 5
+    assert page["next"] is None
+
+
+def test_limit_is_clamped(products):
+    page = products.get(f"/products?limit={MAX_PAGE_SIZE + 100}").json
+
+    assert len(page["items"]) == MAX_PAGE_SIZE
+    assert page["next"] == MAX_PAGE_SIZE
+
+
+def test_default_limit(products):
+    assert len(products.get("/products").json["items"]) == 100
+
+
+def test_users_are_paginated(client):
+    for i in range(3):
+        client.post("/users", json={"name": "n", "address": "a", "email": f"u{i}@example.com"})
+
+    page = client.get("/users?limit=2").json
+    assert [u["id"] for u in page["items"]] == [1, 2]
+    assert page["next"] == 2
+
+    page = client.get("/users?limit=2&cursor=2").json
+    assert [u["id"] for u in page["items"]] == [3]
+    assert page["next"] is None
+
+
+@pytest.mark.parametrize("path", ["/users", "/products"])
+@pytest.mark.parametrize(
+    "query",
+    ["limit=0", "limit=-1", "limit=x", "cursor=-1", "cursor=x", "cursor=99999999999999999999"],
+)
+def test_bad_page_args(client, path, query):
+    response = client.get(f"{path}?{query}")
+
+    assert response.status_code == 400
+    assert "error" in response.json
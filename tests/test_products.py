@@ -0,0 +1,95 @@
+import pytest
+
+from app import Product, app, db
+
+
+def test_bulk_create(client):
+    response = client.post(
+        "/products/bulk",
+        json={"products": [{"product_name": "a", "price": 1}, {"product_name": "b", "price": 2}]},
+    )
+
+    assert response.status_code == 201
+    assert [p["product_name"] for p in response.json] == ["a", "b"]
+    assert len(client.get("/products").json["items"]) == 2
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"products": []},
+        {"products": [{"product_name": "q", "price": -2}]},
+        {"products": [1]},
+    ],
+)
+def test_bulk_create_validation(client, payload):
+    response = client.post("/products/bulk", json=payload)
+
+    assert response.status_code == 400
+    assert "error" in response.json
+
+
+def test_bulk_create_errors_keyed_by_item(client):
+    response = client.post(
+        "/products/bulk",
+        json={"products": [{"product_name": "ok", "price": 1}, {"product_name": "q", "price": -2}]},
+    )
+
+    assert response.status_code == 400
+    assert list(response.json["error"]) == ["1"]
+    with app.app_context():
+        assert db.session.query(Product).count() == 0
+
+
+def test_bulk_create_does_not_modify_existing(client):
+    product_id = client.post("/products", json={"product_name": "a", "price": 1}).json["id"]
+
+    response = client.post(
+        "/products/bulk", json={"products": [{"id": product_id, "product_name": "b", "price": 2}]}
+    )
+
+    assert response.status_code == 409
+    assert client.get(f"/products/{product_id}").json["product_name"] == "a"
+
+
+def product_names(client):
+    return [p["product_name"] for p in client.get("/products").json["items"]]
+
+
+@pytest.fixture
+def cached_product(client):
+    # Prime both cache entries the writes below must invalidate
+    product_id = client.post("/products", json={"product_name": "a", "price": 1}).json["id"]
+    assert client.get(f"/products/{product_id}").json["product_name"] == "a"
+    assert product_names(client) == ["a"]
+    return product_id
+
+
+def test_update_invalidates_cache(client, cached_product):
+    client.put(f"/products/{cached_product}", json={"product_name": "b"})
+
+    assert client.get(f"/products/{cached_product}").json["product_name"] == "b"
+    assert product_names(client) == ["b"]
+
+
+def test_delete_invalidates_cache(client, cached_product):
+    client.delete(f"/products/{cached_product}")
+
+    assert client.get(f"/products/{cached_product}").status_code == 404
+    assert product_names(client) == []
+
+
+def test_create_invalidates_cache(client, cached_product):
+    client.post("/products", json={"product_name": "b", "price": 2})
+
+    assert product_names(client) == ["a", "b"]
+
+
+def test_bulk_create_invalidates_cache(client, cached_product):
+    client.post(
+        "/products/bulk",
+        json={"products": [{"product_name": "b", "price": 2}, {"product_name": "c", "price": 3}]},
+    )
+
+    assert product_names(client) == ["a", "b", "c"]
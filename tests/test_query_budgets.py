@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app import Order, OrderProduct, Product, User, app, db
+
+
+@contextmanager
+def count_queries():
+    # Collects every SQL statement the engine runs inside the block. Listens on
+    # the engine, not one connection, so the request's session is included.
+    queries = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        queries.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def seeded(client):
+    # Several rows per table, so a per-row (N+1) query would exceed the budget
+    with app.app_context():
+        for i in range(3):
+            db.session.add(User(name=f"user{i}", address="addr", email=f"u{i}@example.com"))
+            db.session.add(Product(product_name=f"product{i}", price=1.0 + i))
+        db.session.flush()
+        for _ in range(3):
+            db.session.add(Order(user_id=1))
+        db.session.flush()
+        for order_id in (1, 2, 3):
+            for product_id in (1, 2, 3):
+                db.session.add(OrderProduct(order_id=order_id, product_id=product_id))
+        db.session.commit()
+    return client
+
+
+def request_queries(client, path):
+    with app.app_context(), count_queries() as queries:
+        response = client.get(path)
+    assert response.status_code == 200
+    return queries
+
+
+@pytest.mark.parametrize(
+    "path, budget",
+    [
+        ("/users", 1),
+        ("/products", 1),
+        ("/products/1", 1),
+        ("/users/1", 2),  # version check + full row on a cache miss
+        ("/orders/1/products", 2),  # order + selectinload of its products
+        ("/orders/user/1", 2),  # user exists check + orders
+    ],
+)
+def test_query_budget(seeded, path, budget):
+    assert len(request_queries(seeded, path)) == budget
+
+
+def test_cached_product_reads_skip_the_database(seeded):
+    request_queries(seeded, "/products")
+    request_queries(seeded, "/products/1")
+
+    assert request_queries(seeded, "/products") == []
+    assert request_queries(seeded, "/products/1") == []
+
+
+def test_cached_user_read_only_checks_the_version(seeded):
+    request_queries(seeded, "/users/1")
+
+    assert len(request_queries(seeded, "/users/1")) == 1
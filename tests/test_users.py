@@ -0,0 +1,60 @@
+from uuid import uuid4
+
+from sqlalchemy import update
+
+from app import User, app, db, user_cache
+
+
+def create_user(client, name, email, **extra):
+    response = client.post(
+        "/users", json={"name": name, "address": "addr", "email": email, **extra}
+    )
+    assert response.status_code == 201
+    return response.json["id"]
+
+
+def test_update_then_get_returns_fresh_data(client):
+    user_id = create_user(client, "alice", "a@example.com")
+    assert client.get(f"/users/{user_id}").json["name"] == "alice"
+
+    client.put(f"/users/{user_id}", json={"name": "alicia"})
+
+    assert client.get(f"/users/{user_id}").json["name"] == "alicia"
+
+
+def test_deleted_user_is_not_served_for_a_reused_id(client):
+    user_id = create_user(client, "alice", "a@example.com")
+    assert client.get(f"/users/{user_id}").json["name"] == "alice"
+
+    client.delete(f"/users/{user_id}")
+    assert not [key for key in user_cache if key[0] == user_id]
+    assert create_user(client, "bob", "b@example.com") == user_id
+
+    assert client.get(f"/users/{user_id}").json["name"] == "bob"
+
+
+def test_explicit_id_reuse_is_not_served_stale(client):
+    create_user(client, "alice", "a@example.com", id=77)
+    assert client.get("/users/77").json["name"] == "alice"
+
+    client.delete("/users/77")
+    create_user(client, "bob", "b@example.com", id=77)
+
+    assert client.get("/users/77").json["name"] == "bob"
+
+
+def test_update_racing_another_write_is_a_conflict(client, monkeypatch):
+    user_id = create_user(client, "alice", "a@example.com")
+    real_get = db.session.get
+
+    def get_then_concurrent_update(*args, **kwargs):
+        # Another worker updates the row after this request loaded it
+        user = real_get(*args, **kwargs)
+        with db.engine.begin() as conn:
+            conn.execute(update(User).where(User.id == user_id).values(version_id=uuid4().hex))
+        return user
+
+    with app.app_context():
+        monkeypatch.setattr(db.session, "get", get_then_concurrent_update)
+        assert client.put(f"/users/{user_id}", json={"name": "x"}).status_code == 409
+        assert client.delete(f"/users/{user_id}").status_code == 409